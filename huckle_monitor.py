@@ -2,8 +2,7 @@ import os
 import sys
 import logging
 import time
-import uuid
-from datetime import datetime, timedelta
+from collections import deque
 from huckleberry_api.api import HuckleberryAPI
 from textual.app import App, ComposeResult
 from textual.widgets import Static, Input, Label
@@ -23,6 +22,9 @@ logging.getLogger('huckleberry_api').setLevel(logging.WARNING)
 
 logger = logging.getLogger(__name__)
 
+_EMAIL = os.environ.get('HUCKLEBERRY_EMAIL')
+_PASSWORD = os.environ.get('HUCKLEBERRY_PASSWORD')
+
 class BottleLogScreen(ModalScreen[int]):
     """Screen for logging a bottle feeding."""
     BINDINGS = [("escape", "dismiss", "Dismiss")]
@@ -44,7 +46,7 @@ class BottleLogScreen(ModalScreen[int]):
     def compose(self) -> ComposeResult:
         with Vertical(id="dialog"):
             yield Label("Amount (ml):")
-            yield Input(placeholder="ml", id="amount_input", restrict=r"^[0-9]*$")
+            yield Input(placeholder="ml", id="amount_input", restrict=r"[0-9]*")
 
     def on_mount(self) -> None:
         self.query_one(Input).focus()
@@ -91,12 +93,18 @@ class HuckleberryTUI(App):
 
     def __init__(self):
         super().__init__()
-        self.last_feed_time = None
-        self.last_feed_amount = 0
-        self.last_feed_unit = "ml"
+        self.last_feed_epoch = None
+        self._volume_str = ""
         self.api = None
         self.child_uid = None
+        self._feed_db = None
+        self._feed_ref = None
         self.last_tick = time.time()
+        self._update_offset()
+        self._last_seen_bottle = None
+        self._last_half_minute = None
+        self._updates = deque()
+        self._last_rendered = {}
 
     def compose(self) -> ComposeResult:
         with Grid(id="container"):
@@ -113,7 +121,16 @@ class HuckleberryTUI(App):
 
     def on_mount(self) -> None:
         self.start_monitoring()
+        self.w_last_feed = self.query_one("#last_feed", Static)
+        self.w_last_volume = self.query_one("#last_volume", Static)
+        self.w_elapsed = self.query_one("#elapsed", Static)
+        self.w_nap_time = self.query_one("#nap_time", Static)
+        self.w_short_wake = self.query_one("#short_wake", Static)
+        self.w_long_wake = self.query_one("#long_wake", Static)
         self.set_interval(1, self.update_times)
+        self.set_interval(0.1, self._drain_updates)
+        # Only moves at DST transitions, so an hourly re-check is plenty
+        self.set_interval(3600, self._update_offset)
 
     def action_refresh_connection(self) -> None:
         self.notify("Refreshing connection...")
@@ -146,6 +163,11 @@ class HuckleberryTUI(App):
                     self.call_from_thread(self.notify, f"Refresh failed, retrying in {wait_time}s...", severity="warning")
                     time.sleep(wait_time)
 
+    def _update_offset(self) -> None:
+        # Calculate offset in minutes (UTC - Local)
+        # time.localtime().tm_gmtoff is seconds east of UTC
+        self._offset_min = -time.localtime().tm_gmtoff / 60
+
     def action_log_bottle(self) -> None:
         self.push_screen(BottleLogScreen(), self.do_log_bottle)
 
@@ -159,17 +181,17 @@ class HuckleberryTUI(App):
             
             # Use the underlying firestore client from the API
             # Since we can't easily modify the library, we'll implement it here
-            db = self.api._get_firestore_client()
-            feed_ref = db.collection("feed").document(self.child_uid)
+            feed_ref = self._get_feed_ref()
             
             now_time = time.time()
-            # Calculate offset in minutes (UTC - Local)
-            # time.localtime().tm_gmtoff is seconds east of UTC
-            offset = -time.localtime(now_time).tm_gmtoff / 60
-            interval_id = f"{int(now_time * 1000)}-{uuid.uuid4().hex[:20]}"
-            
+            offset = self._offset_min
+            interval_id = f"{int(now_time * 1000)}-{os.urandom(10).hex()}"
+
+            # Both writes go out in a single commit round-trip
+            batch = self._feed_db.batch()
+
             # Create interval
-            feed_ref.collection("intervals").document(interval_id).set({
+            batch.set(feed_ref.collection("intervals").document(interval_id), {
                 "mode": "bottle",
                 "start": now_time,
                 "amount": float(amount),
@@ -181,7 +203,7 @@ class HuckleberryTUI(App):
             })
             
             # Update prefs
-            feed_ref.update({
+            batch.update(feed_ref, {
                 "prefs.lastBottle": {
                     "mode": "bottle",
                     "start": now_time,
@@ -193,23 +215,31 @@ class HuckleberryTUI(App):
                 "prefs.timestamp": {"seconds": now_time},
                 "prefs.local_timestamp": now_time,
             })
-            
+            batch.commit()
+
             self.call_from_thread(self.notify, f"Logged {amount}ml bottle")
         except Exception as e:
             logger.exception("Failed to log bottle")
             self.call_from_thread(self.notify, f"Error: {e}", severity="error")
 
+    def _get_feed_ref(self):
+        """Return the child's feed document, rebuilt only when the API swaps Firestore clients."""
+        # The API recreates its client after a token refresh, so a reference
+        # bound to the old client must not be reused
+        db = self.api._get_firestore_client()
+        if db is not self._feed_db:
+            self._feed_db = db
+            self._feed_ref = db.collection("feed").document(self.child_uid)
+        return self._feed_ref
+
     @work(exclusive=True, thread=True)
     def start_monitoring(self) -> None:
-        email = os.environ.get('HUCKLEBERRY_EMAIL')
-        password = os.environ.get('HUCKLEBERRY_PASSWORD')
-
-        if not email or not password:
+        if not _EMAIL or not _PASSWORD:
             self.call_from_thread(self.notify, "Missing HUCKLEBERRY_EMAIL or HUCKLEBERRY_PASSWORD", severity="error")
             return
 
         try:
-            self.api = HuckleberryAPI(email, password)
+            self.api = HuckleberryAPI(_EMAIL, _PASSWORD)
             self.api.authenticate()
             
             children = self.api.get_children()
@@ -219,6 +249,8 @@ class HuckleberryTUI(App):
                 
             child = children[0]
             self.child_uid = child['uid']
+            self._feed_db = None
+            self._get_feed_ref()
             
             logger.info(f"Monitoring feeding for: {child['name']}")
             self.api.setup_feed_listener(self.child_uid, self.on_feed_update)
@@ -228,42 +260,71 @@ class HuckleberryTUI(App):
 
     def on_feed_update(self, data):
         """Callback for feed updates from the API listener thread."""
-        logger.debug(f"Raw feed update data: {data}")
-        prefs = data.get('prefs', {})
-        last_bottle = prefs.get('lastBottle', {})
-        
-        if last_bottle:
-            logger.info(f"Last bottle found in prefs: {last_bottle}")
-            start = last_bottle.get('start')
-            if start:
-                # prefs.lastBottle uses bottleAmount/bottleUnits
-                amount = last_bottle.get('bottleAmount', 0)
-                unit = last_bottle.get('bottleUnits', 'ml')
-                logger.info(f"Extracted bottle info: amount={amount}, unit={unit}")
-                
-                self.last_feed_time = datetime.fromtimestamp(start)
-                self.last_feed_amount = int(amount) if amount is not None else 0
-                self.last_feed_unit = unit
-                
-                # Update UI from thread
-                self.call_from_thread(self.refresh_ui)
-        else:
+        logger.debug("Raw feed update data: %s", data)
+        try:
+            last_bottle = data['prefs']['lastBottle']
+            start = last_bottle['start']
+        except (KeyError, TypeError):
             logger.debug("No last bottle found in update.")
+            return
+
+        logger.info("Last bottle found in prefs: %s", last_bottle)
+        if not start:
+            return
+
+        # prefs.lastBottle uses bottleAmount/bottleUnits
+        amount = last_bottle.get('bottleAmount', 0)
+        unit = last_bottle.get('bottleUnits', 'ml')
+        logger.info("Extracted bottle info: amount=%s, unit=%s", amount, unit)
+
+        # Hand off to the main thread (deque.append is thread-safe), see _drain_updates
+        self._updates.append((start, amount, unit))
+
+    def _drain_updates(self) -> None:
+        """Apply the newest bottle queued by the listener thread, dropping older ones."""
+        bottle = None
+        while self._updates:
+            bottle = self._updates.popleft()
+
+        # Prefs pushes often touch other fields; skip if the bottle itself is unchanged
+        if bottle is None or bottle == self._last_seen_bottle:
+            return
+        self._last_seen_bottle = bottle
+
+        start, amount, unit = bottle
+        self.last_feed_epoch = float(start)
+        self._volume_str = f"{int(amount) if amount is not None else 0}{unit}"
+        self.refresh_ui()
 
     def refresh_ui(self) -> None:
-        if self.last_feed_time:
-            time_str = self.last_feed_time.strftime('%H:%M')
-            self.query_one("#last_feed", Static).update(f"[b]{time_str}[/b]")
-            self.query_one("#last_volume", Static).update(f"{self.last_feed_amount}{self.last_feed_unit}")
-            self.update_times()
-
-    def format_diff(self, total_seconds: int) -> str:
-        sign = "+" if total_seconds >= 0 else "-"
-        total_seconds = abs(int(total_seconds))
-        hours, remainder = divmod(total_seconds, 3600)
-        minutes, _ = divmod(remainder, 60)
+        if self.last_feed_epoch is not None:
+            local = time.localtime(self.last_feed_epoch)
+            time_str = f"{local.tm_hour:02d}:{local.tm_min:02d}"
+            with self.batch_update():
+                self._render(self.w_last_feed, f"[b]{time_str}[/b]")
+                self._render(self.w_last_volume, self._volume_str)
+                # New feed, so the timers must be recomputed regardless of the throttle
+                self._last_half_minute = None
+                self.update_times()
+
+    def format_diff(self, total_seconds: float) -> str:
+        if total_seconds >= 0:
+            sign = "+"
+            total_seconds = int(total_seconds)
+        else:
+            sign = "-"
+            total_seconds = int(-total_seconds)
+        hours = total_seconds // 3600
+        minutes = (total_seconds - hours * 3600) // 60
         return f"{sign}{hours}:{minutes:02d}"
 
+    def _render(self, widget: Static, content: str) -> None:
+        """Update a widget only if its content actually changed."""
+        if self._last_rendered.get(widget.id) == content:
+            return
+        self._last_rendered[widget.id] = content
+        widget.update(content)
+
     def update_times(self) -> None:
         current_time = time.time()
         delta = current_time - self.last_tick
@@ -275,29 +336,31 @@ class HuckleberryTUI(App):
             self.notify(f"System wake detected ({delta:.0f}s). Reconnecting...")
             self.refresh_connection()
 
-        if not self.last_feed_time:
+        if self.last_feed_epoch is None:
             return
 
-        now = datetime.now()
-        elapsed_td = now - self.last_feed_time
-        elapsed_seconds = elapsed_td.total_seconds()
-        
-        # Line: +hh:mm
-        self.query_one("#elapsed", Static).update(f"[b]{self.format_diff(elapsed_seconds)}[/b]")
-
-        # Midpoints (in seconds from feed)
-        # Sleepy: 1:07:30 (Midpoint of 1:00-1:15)
-        # Short: 2:07:30 (Midpoint of 2:00-2:15)
-        # Long: 2:37:30 (Midpoint of 2:30-2:45)
-        midpoints = {
-            "#nap_time": 1 * 3600 + 7 * 60 + 30,
-            "#short_wake": 2 * 3600 + 7 * 60 + 30,
-            "#long_wake": 2 * 3600 + 37 * 60 + 30
-        }
-
-        for widget_id, midpoint_sec in midpoints.items():
-            diff_sec = elapsed_seconds - midpoint_sec
-            self.query_one(widget_id, Static).update(f"[b]{self.format_diff(diff_sec)}±7[/b]")
+        elapsed_seconds = current_time - self.last_feed_epoch
+
+        # Elapsed rolls over on whole minutes and the midpoints (all offset by
+        # 30s) on half minutes, so nothing on screen changes within a half minute
+        half_minute = int(elapsed_seconds // 30)
+        if half_minute == self._last_half_minute:
+            return
+        self._last_half_minute = half_minute
+
+        e = elapsed_seconds
+        diff = self.format_diff
+        with self.batch_update():
+            # Line: +hh:mm
+            self._render(self.w_elapsed, f"[b]{diff(e)}[/b]")
+
+            # Midpoints (in seconds from feed)
+            # Sleepy: 1:07:30 (Midpoint of 1:00-1:15)
+            # Short: 2:07:30 (Midpoint of 2:00-2:15)
+            # Long: 2:37:30 (Midpoint of 2:30-2:45)
+            self._render(self.w_nap_time, f"[b]{diff(e - 4050)}±7[/b]")
+            self._render(self.w_short_wake, f"[b]{diff(e - 7650)}±7[/b]")
+            self._render(self.w_long_wake, f"[b]{diff(e - 9450)}±7[/b]")
 
     def on_unmount(self) -> None:
         if self.api: